@@ -49,7 +49,7 @@
 # Modules
 #
 # Standard Python Modules
-import os
+import ast, os, threading
 from configparser import ConfigParser
 
 # VerticaPy Modules
@@ -60,7 +60,127 @@ from verticapy.errors import *
 # Vertica Modules
 import vertica_python
 
+# File storing the auto connections.
+_AUTO_CONNECTION_PATH = os.path.dirname(verticapy.__file__) + "/connections.verticapy"
+
+# Parsed configuration files, keyed by (path, modification time, size).
+# The stored parsers are shared and must never be modified.
+_CONFPARSER_CACHE = {}
+_CONFPARSER_CACHE_LOCK = threading.Lock()
+
+# DSN options which are renamed or converted before being used to create
+# the connection.
+_DSN_RENAME = {
+    "servername": "host",
+    "server": "host",
+    "uid": "user",
+    "pwd": "password",
+    "kerberosservicename": "kerberos_service_name",
+    "kerberoshostname": "kerberos_host_name",
+}
+_DSN_INT_KEYS = frozenset(("port", "connection_timeout"))
+_DSN_BOOL_KEYS = frozenset(
+    (
+        "ssl",
+        "autocommit",
+        "use_prepared_statements",
+        "connection_load_balance",
+        "disable_copy_local",
+    )
+)
+
 #
+# ---#
+def _get_confparser(path: str):
+    """
+---------------------------------------------------------------------------
+Returns the ConfigParser of the input file. The file is only parsed again 
+if it was modified since the last call. The returned object is shared with 
+the other callers: use a copy to modify it.
+    """
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = None
+    with _CONFPARSER_CACHE_LOCK:
+        if key in _CONFPARSER_CACHE:
+            return _CONFPARSER_CACHE[key]
+    confparser = ConfigParser()
+    confparser.optionxform = str
+    confparser.read(path)
+    if key:
+        with _CONFPARSER_CACHE_LOCK:
+            _evict_confparser(path)
+            _CONFPARSER_CACHE[key] = confparser
+    return confparser
+
+
+# ---#
+def _evict_confparser(path: str):
+    """
+---------------------------------------------------------------------------
+Removes the cached ConfigParsers of the input file. It must be called while 
+holding _CONFPARSER_CACHE_LOCK.
+    """
+    path = os.path.abspath(path)
+    for elem in list(_CONFPARSER_CACHE):
+        if elem[0] == path:
+            _CONFPARSER_CACHE.pop(elem, None)
+
+
+# ---#
+def _write_confparser(confparser: ConfigParser, path: str):
+    """
+---------------------------------------------------------------------------
+Writes the ConfigParser in the input file. A rewrite may keep the same size 
+and modification time, so the cached ConfigParsers of the file are removed.
+    """
+    with _CONFPARSER_CACHE_LOCK:
+        f = open(path, "w+")
+        confparser.write(f)
+        f.close()
+        _evict_confparser(path)
+
+
+# ---#
+def _get_dsn_path(dsn: str = ""):
+    """
+---------------------------------------------------------------------------
+Returns the path of the input DSN file. If empty, the ODBCINI environment 
+variable will be used.
+    """
+    if not dsn:
+        dsn = os.environ["ODBCINI"]
+    return dsn
+
+
+# ---#
+def _parse_backup_server_node(value: str):
+    """
+---------------------------------------------------------------------------
+Parses the DSN 'backup_server_node' option. It can be a Python literal, 
+for example ['host1', ('host2', 5433)], or a list of comma-separated hosts 
+with or without brackets. Literals which are not a string, a list or a tuple 
+are parsed as comma-separated hosts.
+    """
+    value = value.strip()
+    try:
+        nodes = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        nodes = None
+    if isinstance(nodes, str):
+        return [nodes]
+    elif isinstance(nodes, (list, tuple)):
+        return nodes
+    return [
+        elem.strip().strip("'\"")
+        for elem in value.strip("()[]{}").split(",")
+        if elem.strip()
+    ]
+
+
 # ---#
 def available_auto_connection():
     """
@@ -76,15 +196,16 @@ See Also
 --------
 new_auto_connection : Saves a connection to automatically create database cursors.
 	"""
-    path = os.path.dirname(verticapy.__file__) + "/connections.verticapy"
-    confparser = ConfigParser()
-    confparser.optionxform = str
+    path = _AUTO_CONNECTION_PATH
     try:
-        confparser.read(path)
-        confparser.remove_section("VERTICAPY_AUTO_CONNECTION")
+        confparser = _get_confparser(path)
     except:
-        pass
-    all_connections = confparser.sections()
+        return []
+    all_connections = [
+        section
+        for section in confparser.sections()
+        if section != "VERTICAPY_AUTO_CONNECTION"
+    ]
     return all_connections
 
 
@@ -105,7 +226,7 @@ new_auto_connection : Saves a connection to automatically create database cursor
 read_auto_connect   : Automatically creates a connection.
 vertica_conn        : Creates a Vertica Database cursor using the input method.
 	"""
-    path = os.path.dirname(verticapy.__file__) + "/connections.verticapy"
+    path = _AUTO_CONNECTION_PATH
     confparser = ConfigParser()
     confparser.optionxform = str
     confparser.read(path)
@@ -113,9 +234,7 @@ vertica_conn        : Creates a Vertica Database cursor using the input method.
         confparser.remove_section("VERTICAPY_AUTO_CONNECTION")
         confparser.add_section("VERTICAPY_AUTO_CONNECTION")
         confparser.set("VERTICAPY_AUTO_CONNECTION", "name", name)
-        f = open(path, "w+")
-        confparser.write(f)
-        f.close()
+        _write_confparser(confparser, path)
     else:
         raise NameError(
             "The input name is incorrect. The connection '{}' has never been created.\nUse the new_auto_connection function to create a new connection.".format(
@@ -152,7 +271,7 @@ read_auto_connect      : Automatically creates a connection.
 vertica_conn           : Creates a Vertica Database connection.
 	"""
     check_types([("dsn", dsn, [dict],)])
-    path = os.path.dirname(verticapy.__file__) + "/connections.verticapy"
+    path = _AUTO_CONNECTION_PATH
     confparser = ConfigParser()
     confparser.optionxform = str
     try:
@@ -164,9 +283,7 @@ vertica_conn           : Creates a Vertica Database connection.
     confparser.add_section(name)
     for elem in dsn:
         confparser.set(name, elem, str(dsn[elem]))
-    f = open(path, "w+")
-    confparser.write(f)
-    f.close()
+    _write_confparser(confparser, path)
     change_auto_connection(name)
 
 
@@ -187,10 +304,8 @@ See Also
 new_auto_connection : Saves a connection to automatically create database cursors.
 vertica_conn        : Creates a Vertica Database cursor using the input method.
 	"""
-    path = os.path.dirname(verticapy.__file__) + "/connections.verticapy"
-    confparser = ConfigParser()
-    confparser.optionxform = str
-    confparser.read(path)
+    path = _AUTO_CONNECTION_PATH
+    confparser = _get_confparser(path)
     section = confparser.get("VERTICAPY_AUTO_CONNECTION", "name")
     return vertica_conn(section, path)
 
@@ -218,34 +333,34 @@ dict
 	dictionary with all the credentials
 	"""
     check_types([("dsn", dsn, [str],), ("section", section, [str],)])
-    confparser = ConfigParser()
-    confparser.optionxform = str
-    if not dsn:
-        dsn = os.environ["ODBCINI"]
-    confparser.read(dsn)
+    confparser = _get_confparser(_get_dsn_path(dsn))
     if confparser.has_section(section):
-        options = confparser.items(section)
+        options = {
+            option_name.lower(): option_val
+            for option_name, option_val in confparser.items(section)
+        }
         conn_info = {"port": 5433, "user": "dbadmin"}
-        for elem in options:
-            if elem[0].lower() in ("servername", "server"):
-                conn_info["host"] = elem[1]
-            elif elem[0].lower() == "uid":
-                conn_info["user"] = elem[1]
-            elif elem[0].lower() == "port":
+        for option_name, option_val in options.items():
+            if option_name in _DSN_RENAME:
+                conn_info[_DSN_RENAME[option_name]] = option_val
+            elif option_name in _DSN_INT_KEYS:
                 try:
-                    conn_info["port"] = int(elem[1])
+                    conn_info[option_name] = int(option_val)
                 except:
-                    conn_info["port"] = elem[1]
-            elif elem[0].lower() == "pwd":
-                conn_info["password"] = elem[1]
-            elif elem[0].lower() == "kerberosservicename":
-                conn_info["kerberos_service_name"] = elem[1]
-            elif elem[0].lower() == "kerberoshostname":
-                conn_info["kerberos_host_name"] = elem[1]
-            elif "vp_test_" in elem[0].lower():
-                conn_info[elem[0].lower()[8:]] = elem[1]
+                    conn_info[option_name] = option_val
+            elif option_name in _DSN_BOOL_KEYS:
+                # Unrecognized values are kept as they are.
+                conn_info[option_name] = ConfigParser.BOOLEAN_STATES.get(
+                    option_val.strip().lower(), option_val
+                )
+            elif option_name == "backup_server_node":
+                conn_info["backup_server_node"] = _parse_backup_server_node(
+                    option_val
+                )
+            elif "vp_test_" in option_name:
+                conn_info[option_name[8:]] = option_val
             else:
-                conn_info[elem[0].lower()] = elem[1]
+                conn_info[option_name] = option_val
         return conn_info
     else:
         raise NameError("The DSN Section '{}' doesn't exist.".format(section))
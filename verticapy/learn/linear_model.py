@@ -48,6 +48,9 @@
 #
 # Modules
 #
+# Standard Python Modules
+import warnings
+
 # VerticaPy Modules
 from verticapy import vDataFrame
 from verticapy.utilities import *
@@ -55,6 +58,58 @@ from verticapy.toolbox import *
 from verticapy.errors import *
 from verticapy.learn.vmodel import *
 
+# Solvers accepted by set_params: the other values are rejected there.
+_ALL_SOLVERS = frozenset(("newton", "bfgs", "cgd"))
+
+# Solvers available for each linear model (and each penalty for the
+# LogisticRegression), in the order displayed by the warning.
+_SOLVERS_ORDER = {
+    "ElasticNet": ("newton", "bfgs", "cgd"),
+    "Lasso": ("newton", "bfgs", "cgd"),
+    "LinearRegression": ("newton", "bfgs"),
+    "LogisticRegression_none": ("bfgs", "newton"),
+    "LogisticRegression_l1": ("bfgs", "newton", "cgd"),
+    "LogisticRegression_l2": ("bfgs", "newton", "cgd"),
+    "LogisticRegression_enet": ("newton", "bfgs", "cgd"),
+    "Ridge": ("newton", "bfgs"),
+}
+_SOLVERS = {key: frozenset(_SOLVERS_ORDER[key]) for key in _SOLVERS_ORDER}
+
+#
+# ---#
+def _check_solver(solver: str, solvers_key: str):
+    """
+---------------------------------------------------------------------------
+Warns the user if the input solver is not one of the available solvers. 
+Solvers which are not accepted by set_params are left to it.
+    """
+    if (solver in _ALL_SOLVERS) and (solver not in _SOLVERS[solvers_key]):
+        warning_message = "Parameter 'solver' must be in [{}], found '{}'".format(
+            "|".join(_SOLVERS_ORDER[solvers_key]), solver
+        )
+        warnings.warn(warning_message, Warning)
+
+
+# ---#
+def _init_linear_model(
+    model, model_type: str, name: str, cursor, parameters: dict, solvers_key: str,
+):
+    """
+---------------------------------------------------------------------------
+Initializes the input linear model. The model parameters which are not in 
+the input dictionary are removed from the model.
+    """
+    check_types([("name", name, [str],)])
+    _check_solver(parameters["solver"], solvers_key)
+    model.type, model.name = model_type, name
+    model.set_params(parameters)
+    for elem in [elem for elem in model.parameters if elem not in parameters]:
+        del model.parameters[elem]
+    cursor = check_cursor(cursor)[0]
+    model.cursor = cursor
+    version(cursor=cursor, condition=[8, 0, 0])
+
+
 # ---#
 class ElasticNet(Regressor):
     """
@@ -96,9 +151,11 @@ l1_ratio: float, optional
         solver: str = "CGD",
         l1_ratio: float = 0.5,
     ):
-        check_types([("name", name, [str],)])
-        self.type, self.name = "LinearRegression", name
-        self.set_params(
+        _init_linear_model(
+            self,
+            "LinearRegression",
+            name,
+            cursor,
             {
                 "penalty": "enet",
                 "tol": tol,
@@ -106,11 +163,9 @@ l1_ratio: float, optional
                 "max_iter": max_iter,
                 "solver": str(solver).lower(),
                 "l1_ratio": l1_ratio,
-            }
+            },
+            "ElasticNet",
         )
-        cursor = check_cursor(cursor)[0]
-        self.cursor = cursor
-        version(cursor=cursor, condition=[8, 0, 0])
 
 
 # ---#
@@ -149,23 +204,20 @@ solver: str, optional
         max_iter: int = 100,
         solver: str = "CGD",
     ):
-        check_types([("name", name, [str],)])
-        self.type, self.name = "LinearRegression", name
-        self.set_params(
+        _init_linear_model(
+            self,
+            "LinearRegression",
+            name,
+            cursor,
             {
                 "penalty": "l1",
                 "tol": tol,
                 "C": C,
                 "max_iter": max_iter,
                 "solver": str(solver).lower(),
-            }
+            },
+            "Lasso",
         )
-        for elem in ["l1_ratio"]:
-            if elem in self.parameters:
-                del self.parameters[elem]
-        cursor = check_cursor(cursor)[0]
-        self.cursor = cursor
-        version(cursor=cursor, condition=[8, 0, 0])
 
 
 # ---#
@@ -200,24 +252,19 @@ solver: str, optional
         max_iter: int = 100,
         solver: str = "Newton",
     ):
-        check_types(
-            [("name", name, [str],), ("solver", solver.lower(), ["newton", "bfgs"],),]
-        )
-        self.type, self.name = "LinearRegression", name
-        self.set_params(
+        _init_linear_model(
+            self,
+            "LinearRegression",
+            name,
+            cursor,
             {
                 "penalty": "none",
                 "tol": tol,
                 "max_iter": max_iter,
                 "solver": str(solver).lower(),
-            }
+            },
+            "LinearRegression",
         )
-        for elem in ["l1_ratio", "C"]:
-            if elem in self.parameters:
-                del self.parameters[elem]
-        cursor = check_cursor(cursor)[0]
-        self.cursor = cursor
-        version(cursor=cursor, condition=[8, 0, 0])
 
 
 # ---#
@@ -267,31 +314,41 @@ l1_ratio: float, optional
         solver: str = "Newton",
         l1_ratio: float = 0.5,
     ):
-        check_types([("name", name, [str],)])
-        self.type, self.name = "LogisticRegression", name
-        self.set_params(
-            {
-                "penalty": str(penalty).lower(),
+        penalty, solver = str(penalty).lower(), str(solver).lower()
+        if penalty == "none":
+            parameters = {
+                "penalty": penalty,
+                "tol": tol,
+                "max_iter": max_iter,
+                "solver": solver,
+            }
+        elif penalty in ("l1", "l2"):
+            parameters = {
+                "penalty": penalty,
                 "tol": tol,
                 "C": C,
                 "max_iter": max_iter,
-                "solver": str(solver).lower(),
+                "solver": solver,
+            }
+        else:
+            parameters = {
+                "penalty": penalty,
+                "tol": tol,
+                "C": C,
+                "max_iter": max_iter,
+                "solver": solver,
                 "l1_ratio": l1_ratio,
             }
+        _init_linear_model(
+            self,
+            "LogisticRegression",
+            name,
+            cursor,
+            parameters,
+            "LogisticRegression_{}".format(
+                penalty if penalty in ("none", "l1", "l2") else "enet"
+            ),
         )
-        if penalty.lower() == "none":
-            for elem in ["l1_ratio", "C"]:
-                if elem in self.parameters:
-                    del self.parameters[elem]
-            check_types([("solver", solver.lower(), ["bfgs", "newton"],)])
-        elif penalty.lower() in ("l1", "l2"):
-            for elem in ["l1_ratio",]:
-            	if elem in self.parameters:
-                	del self.parameters[elem]
-            check_types([("solver", solver.lower(), ["bfgs", "newton", "cgd"],)])
-        cursor = check_cursor(cursor)[0]
-        self.cursor = cursor
-        version(cursor=cursor, condition=[8, 0, 0])
 
 
 # ---#
@@ -329,22 +386,17 @@ solver: str, optional
         max_iter: int = 100,
         solver: str = "Newton",
     ):
-        check_types(
-            [("name", name, [str], ("solver", solver.lower(), ["newton", "bfgs"],),)]
-        )
-        self.type, self.name = "LinearRegression", name
-        self.set_params(
+        _init_linear_model(
+            self,
+            "LinearRegression",
+            name,
+            cursor,
             {
                 "penalty": "l2",
                 "tol": tol,
                 "C": C,
                 "max_iter": max_iter,
                 "solver": str(solver).lower(),
-            }
+            },
+            "Ridge",
         )
-        for elem in ["l1_ratio"]:
-            if elem in self.parameters:
-                del self.parameters[elem]
-        cursor = check_cursor(cursor)[0]
-        self.cursor = cursor
-        version(cursor=cursor, condition=[8, 0, 0])
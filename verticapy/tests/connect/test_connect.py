@@ -11,7 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pytest
+import pytest, os
 from verticapy.connect import *
 
 
@@ -46,3 +46,101 @@ class TestConnect:
         cur.execute("SELECT 1;")
         result = cur.fetchone()
         assert result == [1]
+
+    def test_read_dsn_bool_options(self, tmp_path):
+        path = str(tmp_path / "bool_options.ini")
+        with open(path, "w") as f:
+            f.write(
+                "[bool_test]\n"
+                "host = localhost\n"
+                "autocommit = 1\n"
+                "ssl = off\n"
+                "connection_load_balance = Yes\n"
+                "use_prepared_statements = false\n"
+                "disable_copy_local = maybe\n"
+            )
+        d = read_dsn("bool_test", path)
+        assert d["autocommit"] is True
+        assert d["ssl"] is False
+        assert d["connection_load_balance"] is True
+        assert d["use_prepared_statements"] is False
+        # unrecognized values are kept as they are
+        assert d["disable_copy_local"] == "maybe"
+
+    def test_read_dsn_backup_server_node(self, tmp_path):
+        path = str(tmp_path / "backup_server_node.ini")
+        with open(path, "w") as f:
+            f.write(
+                "[literal]\n"
+                "backup_server_node = ['h1', ('h2', 5434)]\n"
+                "[comma_separated]\n"
+                "backup_server_node = h1, h2\n"
+                "[bracketed_unquoted]\n"
+                "backup_server_node = [h1, h2]\n"
+                "[quoted_scalar]\n"
+                "backup_server_node = 'h1'\n"
+                "[set_literal]\n"
+                "backup_server_node = {'h1', 'h2'}\n"
+                "[int_literal]\n"
+                "backup_server_node = 5433\n"
+                "[bool_literal]\n"
+                "backup_server_node = True\n"
+                "[none_literal]\n"
+                "backup_server_node = None\n"
+            )
+        assert read_dsn("literal", path)["backup_server_node"] == [
+            "h1",
+            ("h2", 5434),
+        ]
+        assert read_dsn("comma_separated", path)["backup_server_node"] == ["h1", "h2"]
+        assert read_dsn("bracketed_unquoted", path)["backup_server_node"] == [
+            "h1",
+            "h2",
+        ]
+        assert read_dsn("quoted_scalar", path)["backup_server_node"] == ["h1"]
+        # other literals are split on commas
+        assert read_dsn("set_literal", path)["backup_server_node"] == ["h1", "h2"]
+        assert read_dsn("int_literal", path)["backup_server_node"] == ["5433"]
+        assert read_dsn("bool_literal", path)["backup_server_node"] == ["True"]
+        assert read_dsn("none_literal", path)["backup_server_node"] == ["None"]
+
+    def test_confparser_cache(self, tmp_path, monkeypatch):
+        import verticapy.connect as vp_connect
+
+        # a rewritten DSN file is read again
+        path = str(tmp_path / "cache.ini")
+        with open(path, "w") as f:
+            f.write("[cache_test]\nhost = host1\n")
+        assert read_dsn("cache_test", path)["host"] == "host1"
+        with open(path, "w") as f:
+            f.write("[cache_test]\nhost = host_22\n")
+        assert read_dsn("cache_test", path)["host"] == "host_22"
+
+        # a rewritten auto connection file is read again
+        auto_path = str(tmp_path / "connections.verticapy")
+        monkeypatch.setattr(vp_connect, "_AUTO_CONNECTION_PATH", auto_path)
+        new_auto_connection({"host": "host1"}, "cache_test_1")
+        new_auto_connection({"host": "host22"}, "cache_test_22")
+        confparser = vp_connect._get_confparser(auto_path)
+        assert confparser.get("VERTICAPY_AUTO_CONNECTION", "name") == "cache_test_22"
+        change_auto_connection("cache_test_1")
+        confparser = vp_connect._get_confparser(auto_path)
+        assert confparser.get("VERTICAPY_AUTO_CONNECTION", "name") == "cache_test_1"
+
+        # available_auto_connection does not modify the cached parser
+        assert sorted(available_auto_connection()) == ["cache_test_1", "cache_test_22"]
+        assert vp_connect._get_confparser(auto_path).has_section(
+            "VERTICAPY_AUTO_CONNECTION"
+        )
+
+        # switching between names of the same length keeps the file size, and
+        # the modification time is pinned: the writer must clear the cache
+        new_auto_connection({"host": "host1"}, "cache_test_a")
+        new_auto_connection({"host": "host1"}, "cache_test_b")
+        stat = os.stat(auto_path)
+        for name in ("cache_test_a", "cache_test_b", "cache_test_a"):
+            change_auto_connection(name)
+            os.utime(auto_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert os.path.getsize(auto_path) == stat.st_size
+            confparser = vp_connect._get_confparser(auto_path)
+            assert confparser.get("VERTICAPY_AUTO_CONNECTION", "name") == name
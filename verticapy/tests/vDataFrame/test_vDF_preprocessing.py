@@ -413,6 +413,26 @@ class TestvDFPreprocessing:
         assert titanic_copy["fare"].dtype() == "int"
         assert titanic_copy["cabin"].dtype() == "varchar(1)"
 
+        # vColumns which already have the input type are not converted
+        nb_transformations = len(titanic_copy["fare"].transformations)
+        nb_history = len(titanic_copy._VERTICAPY_VARIABLES_["history"])
+        titanic_copy.astype({"fare": "INT", "cabin": "varchar(1)"})
+        assert len(titanic_copy["fare"].transformations) == nb_transformations
+        assert len(titanic_copy._VERTICAPY_VARIABLES_["history"]) == nb_history
+
+        # expected exception: no vColumn is converted if one conversion fails
+        age_dtype = titanic_copy["age"].dtype()
+        with pytest.raises(errors.ConversionError):
+            titanic_copy.astype({"age": "int", "sex": "int"})
+        assert titanic_copy["age"].dtype() == age_dtype
+
+        # each conversion is tested on the non-null values of its own vColumn:
+        # the mostly-NULL 'cabin' is tested alongside the dense 'age'
+        with pytest.raises(errors.ConversionError) as exception_info:
+            titanic_copy.astype({"age": "int", "cabin": "int"})
+        assert exception_info.match("cabin")
+        assert titanic_copy["age"].dtype() == age_dtype
+
         ### Testing vDataFrame[].astype
         # expected exception
         with pytest.raises(errors.ConversionError) as exception_info:
@@ -426,6 +446,18 @@ class TestvDFPreprocessing:
         titanic_copy["age"].astype("float")
         assert titanic_copy["age"].dtype() == "float"
 
+        # converting to the current type does nothing
+        nb_transformations = len(titanic_copy["age"].transformations)
+        nb_history = len(titanic_copy._VERTICAPY_VARIABLES_["history"])
+        titanic_copy["age"].astype("FLOAT")
+        assert len(titanic_copy["age"].transformations) == nb_transformations
+        assert len(titanic_copy._VERTICAPY_VARIABLES_["history"]) == nb_history
+
+        # validate = False skips the test query
+        titanic_copy_no_validation = titanic_vd.copy()
+        titanic_copy_no_validation["sex"].astype("int", validate=False)
+        assert titanic_copy_no_validation["sex"].dtype() == "int"
+
     def test_vDF_bool_to_int(self, titanic_vd):
         titanic_copy = titanic_vd.copy()
         titanic_copy["survived"].astype("bool")
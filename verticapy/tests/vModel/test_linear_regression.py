@@ -306,3 +306,9 @@ class TestLinearRegression:
         assert base.cursor.fetchone()[0] == "linreg_from_vDF"
 
         model_test.drop()
+
+    def test_solver_warning(self, base):
+        with pytest.warns(
+            Warning, match=r"Parameter 'solver' must be in \[newton\|bfgs\], found 'cgd'"
+        ):
+            LinearRegression("model_test_solver", cursor=base.cursor, solver="CGD")
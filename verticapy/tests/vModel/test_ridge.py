@@ -315,3 +315,9 @@ class TestRidge:
         assert base.cursor.fetchone()[0] == "ridge_from_vDF"
 
         model_test.drop()
+
+    def test_solver_warning(self, base):
+        with pytest.warns(
+            Warning, match=r"Parameter 'solver' must be in \[newton\|bfgs\], found 'cgd'"
+        ):
+            Ridge("model_test_solver", cursor=base.cursor, solver="CGD")
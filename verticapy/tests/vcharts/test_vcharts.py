@@ -34,41 +34,36 @@ def amazon_vd(base):
     amazon = load_amazon(cursor=base.cursor)
     yield amazon
     with warnings.catch_warnings(record=True) as w:
-        drop(name="public.titanic", cursor=base.cursor)
+        drop(name="public.amazon", cursor=base.cursor)
+
+@pytest.fixture(scope="module")
+def auto_connection(base):
+    d = read_dsn("vp_test_config", os.path.dirname(verticapy.__file__) + "/tests/verticaPy_test_tmp.conf",)
+    new_auto_connection(d, "VerticaDSN_test")
+    change_auto_connection("VerticaDSN_test")
 
 class TestvCharts:
-    def test_vCharts(self, base, titanic_vd, amazon_vd):
+    @pytest.mark.parametrize(
+        "options, query, is_stock",
+        [
+            ("-type pearson", "SELECT * FROM titanic;", False),
+            ("-type scatter", "SELECT age, fare FROM titanic;", False),
+            ("-type scatter", "SELECT age, fare, pclass FROM titanic;", False),
+            ("-type scatter", "SELECT age, fare, parch, pclass FROM titanic;", False),
+            ("-type bubble", "SELECT age, fare, pclass FROM titanic;", False),
+            ("-type bubble", "SELECT age, fare, parch, pclass FROM titanic;", False),
+            ("-type auto", "SELECT age, fare, pclass FROM titanic;", False),
+            ("-type auto", "SELECT age, fare, parch, pclass FROM titanic;", False),
+            ("-type auto", "SELECT pclass, COUNT(*) FROM titanic GROUP BY 1;", False),
+            ("-type auto", "SELECT pclass, survived, COUNT(*) FROM titanic GROUP BY 1, 2;", False),
+            ("-type auto", "SELECT date, number FROM amazon;", True),
+            ("-type auto", "SELECT date, number, state FROM amazon;", True),
+            ("-type line", "SELECT date, number, state FROM amazon;", True),
+        ],
+    )
+    def test_vCharts(self, auto_connection, titanic_vd, amazon_vd, options, query, is_stock):
         from highcharts.highcharts.highcharts import Highchart
         from highcharts.highstock.highstock import Highstock
 
-        d = read_dsn("vp_test_config", os.path.dirname(verticapy.__file__) + "/tests/verticaPy_test_tmp.conf",)
-        new_auto_connection(d, "VerticaDSN_test")
-        change_auto_connection("VerticaDSN_test")
-        result = vCharts("-type pearson", "SELECT * FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type scatter", "SELECT age, fare FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type scatter", "SELECT age, fare, pclass FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type scatter", "SELECT age, fare, parch, pclass FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type bubble", "SELECT age, fare, pclass FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type bubble", "SELECT age, fare, parch, pclass FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type auto", "SELECT age, fare, pclass FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type auto", "SELECT age, fare, parch, pclass FROM titanic;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type auto", "SELECT pclass, COUNT(*) FROM titanic GROUP BY 1;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type auto", "SELECT pclass, survived, COUNT(*) FROM titanic GROUP BY 1, 2;")
-        assert isinstance(result, Highchart)
-        result = vCharts("-type auto", "SELECT date, number FROM amazon;")
-        assert isinstance(result, Highstock)
-        result = vCharts("-type auto", "SELECT date, number, state FROM amazon;")
-        assert isinstance(result, Highstock)
-        result = vCharts("-type line", "SELECT date, number, state FROM amazon;")
-        assert isinstance(result, Highstock)
-
-
+        result = vCharts(options, query)
+        assert isinstance(result, Highstock if is_stock else Highchart)
@@ -219,6 +219,10 @@ def check_cursor(cursor, vdf="", vdf_cursor: bool = False):
 # ---#
 def check_types(types_list: list = [],):
     for elem in types_list:
+        # Most of the time, the parameter has exactly one of the expected
+        # types: nothing else needs to be checked.
+        if type(elem[1]) in elem[2]:
+            continue
         list_check = False
         for sub_elem in elem[2]:
             if not (isinstance(sub_elem, type)):
@@ -49,7 +49,7 @@
 # Modules
 #
 # Standard Python Modules
-import os, math, shutil, re, time, decimal, warnings
+import os, math, shutil, re, time, decimal, warnings, weakref
 from typing import Union
 
 # VerticaPy Modules
@@ -65,6 +65,10 @@ try:
 except:
     pass
 
+# Vertica versions already read, by database connection. The version of
+# a server can not change during a connection: it is only queried once.
+_VERSION_CACHE = weakref.WeakKeyDictionary()
+
 #
 # ---#
 def create_verticapy_schema(cursor=None):
@@ -1801,11 +1805,20 @@ list
     cursor, conn = check_cursor(cursor)[0:2]
     if condition:
         condition = condition + [0 for elem in range(4 - len(condition))]
-    version = (
-        cursor.execute("SELECT version();")
-        .fetchone()[0]
-        .split("Vertica Analytic Database v")[1]
-    )
+    connection = getattr(cursor, "connection", cursor)
+    try:
+        version = _VERSION_CACHE[connection]
+    except (KeyError, TypeError):
+        version = (
+            cursor.execute("SELECT version();")
+            .fetchone()[0]
+            .split("Vertica Analytic Database v")[1]
+        )
+        try:
+            _VERSION_CACHE[connection] = version
+        except TypeError:
+            # The connection can not be weakly referenced.
+            pass
     version = version.split(".")
     result = []
     try:
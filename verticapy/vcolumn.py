@@ -51,6 +51,7 @@
 # Standard Python Modules
 import math, re, decimal, warnings, datetime
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Union
 
 # VerticaPy Modules
@@ -59,6 +60,10 @@ from verticapy.utilities import *
 from verticapy.toolbox import *
 from verticapy.errors import *
 
+# The category only depends on the DB type: the categories of the types
+# used in the vColumns transformations are memorized.
+_category_from_type = lru_cache(maxsize=128)(category_from_type)
+
 ##
 #
 #   __   __   ______     ______     __         __  __     __    __     __   __
@@ -414,7 +419,7 @@ Attributes
                     self.parent._VERTICAPY_VARIABLES_["cursor"],
                     "apply_test_feature",
                 )
-            category = category_from_type(ctype=ctype)
+            category = _category_from_type(ctype=ctype)
             all_cols, max_floor = self.parent.get_columns(), 0
             for column in all_cols:
                 try:
@@ -545,7 +550,7 @@ Attributes
         return self.apply(func=expr)
 
     # ---#
-    def astype(self, dtype: str):
+    def astype(self, dtype: str, validate: bool = True):
         """
 	---------------------------------------------------------------------------
 	Converts the vColumn to the input type.
@@ -554,6 +559,10 @@ Attributes
  	----------
  	dtype: str
  		New type.
+ 	validate: bool, optional
+ 		If set to True, a query is executed to test the conversion. Otherwise, 
+ 		a possible conversion error will only be raised by the next query 
+ 		using the vColumn.
 
  	Returns
  	-------
@@ -564,14 +573,17 @@ Attributes
 	--------
 	vDataFrame.astype : Converts the vColumns to the input type.
 		"""
-        check_types([("dtype", dtype, [str],)])
+        check_types([("dtype", dtype, [str],), ("validate", validate, [bool],)])
+        if str(dtype).strip().lower() == self.ctype():
+            return self.parent
         try:
-            query = "SELECT {}::{} AS {} FROM {} WHERE {} IS NOT NULL LIMIT 20".format(
-                self.alias, dtype, self.alias, self.parent.__genSQL__(), self.alias
-            )
-            self.parent._VERTICAPY_VARIABLES_["cursor"].execute(query)
+            if validate:
+                query = "SELECT {}::{} AS {} FROM {} WHERE {} IS NOT NULL LIMIT 20".format(
+                    self.alias, dtype, self.alias, self.parent.__genSQL__(), self.alias
+                )
+                self.parent._VERTICAPY_VARIABLES_["cursor"].execute(query)
             self.transformations += [
-                ("{}::{}".format("{}", dtype), dtype, category_from_type(ctype=dtype))
+                ("{}::{}".format("{}", dtype), dtype, _category_from_type(ctype=dtype))
             ]
             self.parent.__add_to_history__(
                 "[AsType]: The vColumn {} was converted to {}.".format(
@@ -2296,7 +2308,7 @@ Attributes
     vDataFrame[].isdate : Returns True if the vColumn category is date.
     vDataFrame[].isnum  : Returns True if the vColumn is numerical.
         """
-        return self.ctype().lower() in ("bool", "boolean")
+        return self.ctype().startswith("bool")
 
     # ---#
     def isdate(self):
@@ -1298,6 +1298,20 @@ vColumns : vColumn
             return "VERTICAPY_NOT_PRECOMPUTED"
         return result
 
+    # ---#
+    def __get_column_types__(self, exclude_columns: list = []):
+        """
+    ---------------------------------------------------------------------------
+    Returns a dictionary mapping each vColumn to its (DB type, category). 
+    The names returned by get_columns are exact: each vColumn is directly 
+    accessed as an attribute, without the name lookup of __getitem__.
+        """
+        column_types = {}
+        for column in self.get_columns(exclude_columns=exclude_columns):
+            vcol = getattr(self, column)
+            column_types[column] = (vcol.ctype(), vcol.category())
+        return column_types
+
     # ---#
     def __update_catalog__(
         self,
@@ -2039,6 +2053,7 @@ vColumns : vColumn
                 values[column] = result[i : i + len(func)]
                 i += len(func)
         except:
+            relation = self.__genSQL__()
             try:
                 query = [
                     "SELECT {} FROM vdf_table LIMIT 1".format(
@@ -2052,7 +2067,7 @@ vColumns : vColumn
                     else query[0]
                 )
                 query = "WITH vdf_table AS (SELECT * FROM {}) {}".format(
-                    self.__genSQL__(), query
+                    relation, query
                 )
                 if nb_precomputed == len(func) * len(columns):
                     self._VERTICAPY_VARIABLES_["cursor"].execute(query)
@@ -2073,7 +2088,7 @@ vColumns : vColumn
                             if pre_comp == "VERTICAPY_NOT_PRECOMPUTED":
                                 query = "SELECT {} FROM {}".format(
                                     ", ".join([agg_format(item) for item in elem]),
-                                    self.__genSQL__(),
+                                    relation,
                                 )
                                 self.__executeSQL__(
                                     query,
@@ -2098,7 +2113,7 @@ vColumns : vColumn
                             pre_comp = self.__get_catalog_value__(columns[i], func[j])
                             if pre_comp == "VERTICAPY_NOT_PRECOMPUTED":
                                 query = "SELECT {} FROM {}".format(
-                                    agg_fun, self.__genSQL__()
+                                    agg_fun, relation
                                 )
                                 self.__executeSQL__(
                                     query,
@@ -3073,8 +3088,50 @@ vColumns : vColumn
         """
         check_types([("dtype", dtype, [dict],)])
         columns_check([elem for elem in dtype], self)
+        new_types = {}
         for column in dtype:
-            self[vdf_columns_names([column], self)[0]].astype(dtype=dtype[column])
+            column_name = vdf_columns_names([column], self)[0]
+            # vColumns which already have the input type are not converted.
+            if str(dtype[column]).strip().lower() != self[column_name].ctype():
+                new_types[column_name] = dtype[column]
+        if not (new_types):
+            return self
+        # Each conversion is tested on the first 20 non-null values of its
+        # vColumn. All the tests are gathered in a single query.
+        relation = self.__genSQL__()
+        queries = {
+            column: "SELECT {}::{}::VARCHAR FROM {} WHERE {} IS NOT NULL LIMIT 20".format(
+                column, new_types[column], relation, column
+            )
+            for column in new_types
+        }
+        query = " UNION ALL ".join(
+            ["({})".format(queries[column]) for column in queries]
+        )
+        try:
+            self.__executeSQL__(query=query, title="Tests the types conversion.")
+        except Exception as e:
+            # The conversions are tested one at a time to find the failing one.
+            for column in queries:
+                try:
+                    self.__executeSQL__(
+                        query=queries[column], title="Tests the type conversion."
+                    )
+                except Exception as column_error:
+                    raise ConversionError(
+                        "{}\nThe vColumn {} can not be converted to {}".format(
+                            column_error, column, new_types[column]
+                        )
+                    )
+            raise ConversionError(
+                "{}\nThe vColumns {} can not be converted to {}".format(
+                    e,
+                    ", ".join([column for column in new_types]),
+                    ", ".join([new_types[column] for column in new_types]),
+                )
+            )
+        for column in new_types:
+            self[column].astype(dtype=new_types[column], validate=False)
         return self
 
     # ---#
@@ -3376,9 +3433,9 @@ vColumns : vColumn
     --------
     vDataFrame.astype : Converts the vColumns to the input types.
         """
-        columns = self.get_columns()
-        for column in columns:
-            if self[column].isbool():
+        column_types = self.__get_column_types__()
+        for column in column_types:
+            if column_types[column][0].startswith("bool"):
                 self[column].astype("int")
         return self
 
@@ -3529,22 +3586,40 @@ vColumns : vColumn
                              vDataFrame.
         """
         check_types([("max_cardinality", max_cardinality, [int, float],)])
-        columns = []
-        for column in self.get_columns():
-            if (self[column].category() == "int") and not (self[column].isbool()):
-                self._VERTICAPY_VARIABLES_["cursor"].execute(
-                    "SELECT (APPROXIMATE_COUNT_DISTINCT({}) < {}) FROM {}".format(
-                        column, max_cardinality, self.__genSQL__()
-                    )
-                )
-                is_cat = self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]
-            elif self[column].category() == "float":
-                is_cat = False
-            else:
-                is_cat = True
-            if is_cat:
-                columns += [column]
-        return columns
+        column_types = self.__get_column_types__()
+        int_columns = [
+            column
+            for column in column_types
+            if (column_types[column][1] == "int")
+            and not (column_types[column][0].startswith("bool"))
+        ]
+        is_cat_int = {}
+        if int_columns:
+            query = "SELECT {} FROM {}".format(
+                ", ".join(
+                    [
+                        "(APPROXIMATE_COUNT_DISTINCT({}) < {})".format(
+                            column, max_cardinality
+                        )
+                        for column in int_columns
+                    ]
+                ),
+                self.__genSQL__(),
+            )
+            self.__executeSQL__(
+                query=query, title="Computes the cardinality of the int vColumns."
+            )
+            result = self._VERTICAPY_VARIABLES_["cursor"].fetchone()
+            is_cat_int = dict(zip(int_columns, result))
+        return [
+            column
+            for column in column_types
+            if (
+                is_cat_int[column]
+                if (column in is_cat_int)
+                else (column_types[column][1] != "float")
+            )
+        ]
 
     # ---#
     def cdt(self, 
@@ -4376,12 +4451,10 @@ vColumns : vColumn
     vDataFrame.numcol : Returns a list of names of the numerical vColumns in the 
                         vDataFrame.
         """
-        columns = []
-        cols = self.get_columns()
-        for column in cols:
-            if self[column].isdate():
-                columns += [column]
-        return columns
+        column_types = self.__get_column_types__()
+        return [
+            column for column in column_types if column_types[column][1] == "date"
+        ]
 
     # ---#
     def del_catalog(self):
@@ -4968,10 +5041,11 @@ vColumns : vColumn
         An object containing the result. For more information, see
         utilities.tablesample.
         """
-        values = {"index": [], "dtype": []}
-        for column in self.get_columns():
-            values["index"] += [column]
-            values["dtype"] += [self[column].ctype()]
+        columns = self.get_columns()
+        values = {
+            "index": columns,
+            "dtype": [getattr(self, column).ctype() for column in columns],
+        }
         return tablesample(values)
 
     # ---#
@@ -6734,6 +6808,7 @@ vColumns : vColumn
                 all_are_num = False
             if not (self[column].isdate()):
                 all_are_date = False
+        relation = self.__genSQL__()
         for column in columns:
             conv = ""
             if not (all_are_num) and not (all_are_num):
@@ -6748,7 +6823,7 @@ vColumns : vColumn
                     column,
                     conv,
                     val_name,
-                    self.__genSQL__(),
+                    relation,
                 )
             ]
         query = " UNION ALL ".join(query)
@@ -6834,11 +6909,12 @@ vColumns : vColumn
     vDataFrame.catcol      : Returns the categorical type vColumns in the vDataFrame.
     vDataFrame.get_columns : Returns the vColumns of the vDataFrame.
         """
-        columns, cols = [], self.get_columns(exclude_columns=exclude_columns)
-        for column in cols:
-            if self[column].isnum():
-                columns += [column]
-        return columns
+        column_types = self.__get_column_types__(exclude_columns=exclude_columns)
+        return [
+            column
+            for column in column_types
+            if column_types[column][1] in ("float", "int")
+        ]
 
     # ---#
     def nunique(self, columns: list = []):